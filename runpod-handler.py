@@ -17,18 +17,61 @@ Network Volume Structure:
 │       └── your_lora_models.safetensors
 └── ComfyUI/
     └── (your ComfyUI installation)
+
+Result Storage (optional):
+Set S3_BUCKET (plus S3_ENDPOINT_URL for R2 or other S3-compatible stores,
+S3_URL_EXPIRES for the presigned URL lifetime, and the usual AWS_*
+credentials) to upload images and return presigned URLs in `image_urls`.
+Requires boto3. Without it, or with params.return_base64, images are
+returned as base64 in `images`.
 """
 
 import runpod
 import json
+import logging
 import os
 import sys
 import uuid
 import base64
+import fnmatch
+import heapq
 import requests
+from requests.adapters import HTTPAdapter
 from pathlib import Path
 import subprocess
 import time
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+
+try:
+    import boto3
+except ImportError:
+    boto3 = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Log level is configurable per deployment (e.g. LOG_LEVEL=WARNING or 30)
+_log_level_name = (os.environ.get('LOG_LEVEL') or 'INFO').strip().upper()
+if _log_level_name.isdigit():
+    _log_level = int(_log_level_name)
+else:
+    # getLevelName returns an int for known names and a string otherwise
+    _log_level = logging.getLevelName(_log_level_name)
+_log_level_valid = isinstance(_log_level, int)
+logging.basicConfig(
+    level=_log_level if _log_level_valid else logging.INFO,
+    format='%(message)s',
+    stream=sys.stdout,
+)
+logger = logging.getLogger("runpod-handler")
+if not _log_level_valid:
+    logger.warning("⚠️ Unknown LOG_LEVEL %r, using INFO", _log_level_name)
 
 # Add ComfyUI to Python path if installed in network volume
 NETWORK_VOLUME = "/runpod-volume"
@@ -36,109 +79,335 @@ COMFYUI_PATH = os.path.join(NETWORK_VOLUME, "ComfyUI")
 if os.path.exists(COMFYUI_PATH):
     sys.path.insert(0, COMFYUI_PATH)
 
+# Models the default workflow needs; paths are fixed for the worker's lifetime
+MODELS_PATH = f"{NETWORK_VOLUME}/models"
+_MODEL_PATHS = {
+    "checkpoint": f"{MODELS_PATH}/checkpoints/flux1-dev.safetensors",
+    "vae": f"{MODELS_PATH}/vae/ae.safetensors",
+    "clip1": f"{MODELS_PATH}/clip/t5xxl_fp16.safetensors",
+    "clip2": f"{MODELS_PATH}/clip/clip_l.safetensors",
+}
+
+# Set up model paths to point to network volume
+os.environ['COMFYUI_MODEL_PATH'] = MODELS_PATH
+
+# Import ComfyUI modules; a broken install should fail the worker at start
+from execution import PromptExecutor
+from server import PromptServer
+import nodes
+
+# Optional workflow JSON run once at startup to pre-load models into VRAM
+WARMUP_WORKFLOW_PATH = os.environ.get('WARMUP_WORKFLOW_PATH')
+
+# ComfyUI state shared across requests on a warm worker
+_EXECUTOR = None
+_initialized = False
+
+# PromptExecutor.execute() calls asyncio.run(), which fails on the event loop
+# runpod calls the handler from; run it on one dedicated thread instead
+_COMFY_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="comfyui")
+
+# Set once validate_models() has found every model; a miss is always rechecked
+_MODELS_OK = False
+
+# Shared pool for image encoding and uploads (both release the GIL)
+_ENCODE_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="encode")
+
+# Optional object storage for results; images are returned as base64 without it
+S3_BUCKET = os.environ.get('S3_BUCKET')
+S3_URL_EXPIRES = 3600
+try:
+    S3_URL_EXPIRES = int(os.environ.get('S3_URL_EXPIRES') or S3_URL_EXPIRES)
+except ValueError:
+    logger.warning("⚠️ Invalid S3_URL_EXPIRES %r, using %d", os.environ['S3_URL_EXPIRES'], S3_URL_EXPIRES)
+_S3_CLIENT = None
+if S3_BUCKET:
+    if boto3 is None:
+        logger.warning("⚠️ S3_BUCKET is set but boto3 is not installed; returning images as base64")
+    else:
+        _S3_CLIENT = boto3.client('s3', endpoint_url=os.environ.get('S3_ENDPOINT_URL'))
+
+# Keep-alive session so webhook calls reuse the TCP/TLS connection
+_WEBHOOK_SESSION = requests.Session()
+_WEBHOOK_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+_WEBHOOK_SESSION.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+_WEBHOOK_SESSION.headers['Content-Type'] = 'application/json'
+
+# Webhooks are delivered off the request path by a few daemon threads.
+# No new attempt starts more than WEBHOOK_TIMEOUT seconds after a webhook is
+# queued, and the handler waits at most that long for its final status. The
+# requests timeout is per socket operation, so a slow endpoint can keep a
+# delivery thread busy past the deadline, but never the handler.
+WEBHOOK_MAX_ATTEMPTS = 3
+WEBHOOK_TIMEOUT = 10
+WEBHOOK_WORKERS = 4
+_WEBHOOK_Q = queue.Queue()
+
+class _HeadlessServer:
+    """Stand-in for PromptServer: this worker has no websocket clients to notify"""
+    def __init__(self):
+        self.client_id = None
+        self.last_node_id = None
+        self.sockets_metadata = {}
+
+    def send_sync(self, event, data, sid=None):
+        pass
+
+    def send_progress_text(self, text, node_id, sid=None):
+        pass
+
+    def queue_updated(self):
+        pass
+
 def setup_comfyui():
-    """Initialize ComfyUI from network volume"""
-    try:
-        # Set up model paths to point to network volume
-        os.environ['COMFYUI_MODEL_PATH'] = os.path.join(NETWORK_VOLUME, "models")
+    """Initialize ComfyUI from network volume (runs once per worker)"""
+    global _EXECUTOR, _initialized
+    if _initialized:
+        return
         
-        # Import ComfyUI modules
-        from execution import PromptExecutor
-        from server import PromptServer
-        import nodes
-        import comfy.model_management as mm
+    # Progress messages are dropped; nodes that use PromptServer.instance get the same sink
+    server = _HeadlessServer()
+    PromptServer.instance = server
+    _EXECUTOR = PromptExecutor(server)
+    _initialized = True
+    
+    logger.info("✅ ComfyUI initialized from network volume")
+
+# Create the executor at worker start; any failure here stops the worker
+setup_comfyui()
+
+def warmup_models():
+    """Run the warm-up workflow once so the first request skips model loading"""
+    if not WARMUP_WORKFLOW_PATH:
+        return
         
-        print("✅ ComfyUI initialized from network volume")
-        return True
+    try:
+        with open(WARMUP_WORKFLOW_PATH, 'r') as f:
+            workflow = json.load(f)
+        _COMFY_POOL.submit(_EXECUTOR.execute, workflow, f"warmup-{uuid.uuid4()}").result()
+        logger.info("🔥 Warm-up workflow completed: %s", WARMUP_WORKFLOW_PATH)
     except Exception as e:
-        print(f"❌ Failed to initialize ComfyUI: {str(e)}")
-        return False
+        logger.warning("⚠️ Warm-up workflow failed: %s", e)
 
 def validate_models():
-    """Check if required models exist in network volume"""
-    models_path = os.path.join(NETWORK_VOLUME, "models")
-    required_models = {
-        "checkpoint": os.path.join(models_path, "checkpoints/flux1-dev.safetensors"),
-        "vae": os.path.join(models_path, "vae/ae.safetensors"),
-        "clip1": os.path.join(models_path, "clip/t5xxl_fp16.safetensors"),
-        "clip2": os.path.join(models_path, "clip/clip_l.safetensors"),
-    }
+    """Check if required models exist in network volume (cached once found)"""
+    global _MODELS_OK
+    if _MODELS_OK:
+        return True
     
-    missing_models = []
-    for model_type, path in required_models.items():
-        if not os.path.exists(path):
-            missing_models.append(f"{model_type}: {path}")
+    # os.access(F_OK) is a single faccessat call with no stat buffer to fill
+    missing_models = [
+        f"{model_type}: {path}"
+        for model_type, path in _MODEL_PATHS.items()
+        if not os.access(path, os.F_OK)
+    ]
     
     if missing_models:
-        print("❌ Missing models:")
+        logger.error("❌ Missing models:")
         for missing in missing_models:
-            print(f"   {missing}")
+            logger.error("   %s", missing)
         return False
     
-    print("✅ All required models found in network volume")
+    logger.info("✅ All required models found in network volume")
+    _MODELS_OK = True
     return True
 
+# Validate once at worker start; handler() reuses the cached result
+validate_models()
+
 def execute_comfyui_workflow(workflow, job_id):
     """Execute ComfyUI workflow and return results"""
     try:
-        print(f"🎨 Executing workflow for job: {job_id}")
+        logger.info("🎨 Executing workflow for job: %s", job_id)
         
         # Here you would integrate with your ComfyUI execution logic
         # This is a simplified example - adjust based on your ComfyUI setup
         
-        from execution import PromptExecutor
-        import comfy.model_management as mm
-        
-        # Initialize executor
-        executor = PromptExecutor()
-        
-        # Execute the workflow
-        results = executor.execute(workflow, job_id)
+        # Execute the workflow on the executor created at worker start
+        results = _COMFY_POOL.submit(_EXECUTOR.execute, workflow, job_id).result()
         
-        print(f"✅ Workflow execution completed for job: {job_id}")
+        logger.info("✅ Workflow execution completed for job: %s", job_id)
         return results
         
     except Exception as e:
-        print(f"❌ Workflow execution failed: {str(e)}")
+        logger.error("❌ Workflow execution failed: %s", e)
         raise e
 
+def _encode_one(image_path):
+    """Read a single image and return it as a base64 string, or None on failure"""
+    try:
+        with open(image_path, 'rb', buffering=0) as img_file:
+            # Read into a pre-sized buffer to avoid an intermediate bytes copy
+            buf = bytearray(os.fstat(img_file.fileno()).st_size)
+            view = memoryview(buf)
+            filled = 0
+            while filled < len(buf):
+                n = img_file.readinto(view[filled:])
+                if not n:
+                    break
+                filled += n
+        # A file that shrank after fstat must not be padded with zero bytes
+        base64_data = base64.b64encode(view[:filled]).decode('ascii')
+        logger.info("✅ Converted image to base64: %s", image_path)
+        return base64_data
+    except Exception as e:
+        logger.error("❌ Failed to convert image %s: %s", image_path, e)
+        return None
+
 def convert_images_to_base64(image_paths):
     """Convert generated images to base64 for return"""
-    base64_images = []
+    # map() yields results in input order, so image order is preserved
+    results = _ENCODE_POOL.map(_encode_one, image_paths)
+    return [data for data in results if data is not None]
+
+def _upload_one(image_path, key):
+    """Upload a single image to the results bucket and return a presigned URL"""
+    _S3_CLIENT.upload_file(image_path, S3_BUCKET, key, ExtraArgs={'ContentType': 'image/png'})
+    logger.info("☁️ Uploaded image to s3://%s/%s", S3_BUCKET, key)
+    return _S3_CLIENT.generate_presigned_url(
+        'get_object',
+        Params={'Bucket': S3_BUCKET, 'Key': key},
+        ExpiresIn=S3_URL_EXPIRES,
+    )
+
+def upload_images_to_s3(image_paths, user_id, job_id):
+    """Upload generated images in parallel and return presigned URLs"""
+    keys = [f"{user_id}/{job_id}/{i}.png" for i in range(len(image_paths))]
+    return list(_ENCODE_POOL.map(_upload_one, image_paths, keys))
+
+def find_generated_images(output_dir, job_id, limit):
+    """Find images for this job, falling back to the most recent PNGs"""
+    job_pattern = f"runpod_generation*{job_id}*.png"
+    job_images = []
+    all_images = []
+    
+    # One directory pass serves both the job lookup and the fallback
+    try:
+        it = os.scandir(output_dir)
+    except FileNotFoundError:
+        return []
+    
+    with it:
+        for entry in it:
+            if not entry.name.endswith('.png') or entry.name.startswith('.'):
+                continue
+            if fnmatch.fnmatchcase(entry.name, job_pattern):
+                job_images.append(entry.path)
+            elif not job_images:
+                try:
+                    all_images.append((entry.stat().st_mtime, entry.path))
+                except OSError:
+                    # Removed since the directory was listed; skip it
+                    continue
     
-    for image_path in image_paths:
+    if job_images:
+        return job_images
+    
+    # Fallback: take the most recent images by modification time
+    return [path for _, path in heapq.nlargest(limit, all_images)]
+
+def _build_webhook_body(job_id, status, timestamp, output, error):
+    """Build and serialize a webhook payload once, before any retries"""
+    payload = {
+        'job_id': job_id,
+        'status': status,
+        'timestamp': timestamp
+    }
+    
+    if output:
+        payload['output'] = output
+    if error:
+        payload['error'] = error
+        
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode('utf-8')
+
+def _webhook_worker():
+    """Deliver queued webhooks in the background, retrying with backoff"""
+    while True:
+        webhook_url, job_id, status, timestamp, deadline, output, error, done = _WEBHOOK_Q.get()
         try:
-            with open(image_path, 'rb') as img_file:
-                base64_data = base64.b64encode(img_file.read()).decode('utf-8')
-                base64_images.append(base64_data)
-                print(f"✅ Converted image to base64: {image_path}")
+            body = _build_webhook_body(job_id, status, timestamp, output, error)
+            reason = "delivery deadline passed"
+            for attempt in range(WEBHOOK_MAX_ATTEMPTS):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    # Content-Type is set on the session; body is already JSON
+                    response = _WEBHOOK_SESSION.post(webhook_url, data=body, timeout=remaining)
+                    if response.status_code < 400:
+                        logger.info("📡 Webhook sent: %s for job %s", status, job_id)
+                        reason = None
+                        break
+                    reason = f"HTTP {response.status_code}"
+                    if response.status_code < 500:
+                        # Client errors won't succeed on retry
+                        break
+                except requests.RequestException as e:
+                    reason = str(e)
+                
+                backoff = 0.5 * (2 ** attempt)
+                if attempt + 1 < WEBHOOK_MAX_ATTEMPTS and time.monotonic() + backoff < deadline:
+                    time.sleep(backoff)
+                else:
+                    break
+            if reason:
+                logger.warning("⚠️ Failed to send webhook: %s for job %s: %s", status, job_id, reason)
         except Exception as e:
-            print(f"❌ Failed to convert image {image_path}: {str(e)}")
-    
-    return base64_images
+            logger.warning("⚠️ Failed to send webhook: %s", e)
+        finally:
+            if done is not None:
+                done.set()
+            _WEBHOOK_Q.task_done()
+
+for _i in range(WEBHOOK_WORKERS):
+    threading.Thread(target=_webhook_worker, name=f"webhook-{_i}", daemon=True).start()
 
 def send_webhook(webhook_url, status, job_id, output=None, error=None):
-    """Send status update to webhook URL"""
+    """Queue a status update for the webhook URL"""
     if not webhook_url:
         return
         
     try:
-        payload = {
-            'job_id': job_id,
-            'status': status,
-            'timestamp': int(time.time())
-        }
+        # Payload construction and serialization happen on the webhook thread
+        deadline = time.monotonic() + WEBHOOK_TIMEOUT
         
-        if output:
-            payload['output'] = output
-        if error:
-            payload['error'] = error
-            
-        response = requests.post(webhook_url, json=payload, timeout=10)
-        print(f"📡 Webhook sent: {status} for job {job_id}")
+        # Final statuses are waited on so the worker isn't torn down mid-POST;
+        # only this job's webhook is awaited, not the whole queue
+        done = threading.Event() if status in ('COMPLETED', 'FAILED') else None
+        _WEBHOOK_Q.put_nowait((webhook_url, job_id, status, int(time.time()), deadline, output, error, done))
+        
+        if done is not None and not done.wait(WEBHOOK_TIMEOUT):
+            logger.warning("⚠️ Webhook %s for job %s still pending after %ds", status, job_id, WEBHOOK_TIMEOUT)
         
     except Exception as e:
-        print(f"⚠️ Failed to send webhook: {str(e)}")
+        logger.warning("⚠️ Failed to send webhook: %s", e)
+
+@dataclass(slots=True)
+class Job:
+    """Per-request input, parsed once from the event"""
+    job_id: str
+    user_id: str
+    workflow: dict
+    params: dict
+    webhook_url: Optional[str]
+    prompt: str
+    batch_size: int
+
+    @classmethod
+    def from_input(cls, input_data):
+        params = input_data.get('params', {})
+        return cls(
+            job_id=input_data.get('job_id', str(uuid.uuid4())),
+            user_id=input_data.get('user_id', 'unknown'),
+            workflow=input_data.get('workflow', {}),
+            params=params,
+            webhook_url=input_data.get('webhook_url'),
+            prompt=params.get('prompt') or '',
+            batch_size=params.get('batch_size', 1),
+        )
 
 def handler(event):
     """
@@ -159,52 +428,45 @@ def handler(event):
     """
     
     try:
-        print("🚀 RunPod Text-to-Image Handler Started")
-        print(f"📥 Input: {json.dumps(event.get('input', {}), indent=2)}")
-        
         # Extract input data
         input_data = event.get('input', {})
-        job_id = input_data.get('job_id', str(uuid.uuid4()))
-        user_id = input_data.get('user_id', 'unknown')
-        workflow = input_data.get('workflow', {})
-        params = input_data.get('params', {})
-        webhook_url = input_data.get('webhook_url')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📥 Input: %s", json.dumps(input_data)[:512])
+        job = Job.from_input(input_data)
         
-        print(f"🆔 Processing job: {job_id} for user: {user_id}")
+        # One coalesced record instead of several flushed lines per request
+        logger.info(
+            "🚀 RunPod Text-to-Image Handler Started\n"
+            "🆔 Processing job: %s for user: %s\n"
+            "🎯 Prompt: %.100s...",
+            job.job_id, job.user_id, job.prompt,
+        )
         
         # Validate input
-        if not workflow:
+        if not job.workflow:
             error_msg = "Missing workflow in input"
-            print(f"❌ {error_msg}")
-            send_webhook(webhook_url, 'FAILED', job_id, error=error_msg)
+            logger.error("❌ %s", error_msg)
+            send_webhook(job.webhook_url, 'FAILED', job.job_id, error=error_msg)
             return {"error": error_msg}
             
-        if not params.get('prompt'):
+        if not job.prompt:
             error_msg = "Missing prompt in params"
-            print(f"❌ {error_msg}")
-            send_webhook(webhook_url, 'FAILED', job_id, error=error_msg)
+            logger.error("❌ %s", error_msg)
+            send_webhook(job.webhook_url, 'FAILED', job.job_id, error=error_msg)
             return {"error": error_msg}
         
         # Send initial webhook
-        send_webhook(webhook_url, 'IN_PROGRESS', job_id)
+        send_webhook(job.webhook_url, 'IN_PROGRESS', job.job_id)
         
-        # Initialize ComfyUI if not already done
-        if not setup_comfyui():
-            error_msg = "Failed to initialize ComfyUI"
-            send_webhook(webhook_url, 'FAILED', job_id, error=error_msg)
-            return {"error": error_msg}
-            
-        # Validate models exist
+        # Validate models exist (free once they have been found)
         if not validate_models():
             error_msg = "Required models not found in network volume"
-            send_webhook(webhook_url, 'FAILED', job_id, error=error_msg)
+            send_webhook(job.webhook_url, 'FAILED', job.job_id, error=error_msg)
             return {"error": error_msg}
         
-        print(f"🎯 Generating image with prompt: {params['prompt'][:100]}...")
-        
         # Execute the workflow
         try:
-            results = execute_comfyui_workflow(workflow, job_id)
+            results = execute_comfyui_workflow(job.workflow, job.job_id)
             
             # Process results (this depends on your ComfyUI workflow structure)
             generated_images = []
@@ -214,65 +476,69 @@ def handler(event):
             output_dir = os.path.join(COMFYUI_PATH, "output")
             
             # Find the most recent images with our job prefix
-            import glob
-            image_pattern = os.path.join(output_dir, f"runpod_generation*{job_id}*.png")
-            image_files = glob.glob(image_pattern)
-            
-            if not image_files:
-                # Fallback: look for any recent images
-                image_pattern = os.path.join(output_dir, "*.png")
-                all_images = glob.glob(image_pattern)
-                # Sort by modification time and take the most recent
-                all_images.sort(key=os.path.getmtime, reverse=True)
-                image_files = all_images[:params.get('batch_size', 1)]
+            image_files = find_generated_images(output_dir, job.job_id, job.batch_size)
             
             if image_files:
-                print(f"📸 Found {len(image_files)} generated images")
-                
-                # Convert to base64
-                base64_images = convert_images_to_base64(image_files)
+                logger.info("📸 Found %d generated images", len(image_files))
                 
                 # Prepare output
                 output = {
-                    'images': base64_images,
-                    'job_id': job_id,
-                    'prompt': params['prompt'],
-                    'image_count': len(base64_images),
-                    'generation_params': params
+                    'job_id': job.job_id,
+                    'prompt': job.prompt,
+                    'generation_params': job.params
                 }
                 
+                # Upload to object storage unless the caller asked for base64
+                image_urls = None
+                if _S3_CLIENT is not None and not job.params.get('return_base64'):
+                    try:
+                        image_urls = upload_images_to_s3(image_files, job.user_id, job.job_id)
+                    except Exception as upload_error:
+                        logger.warning("⚠️ Upload failed, returning base64 instead: %s", upload_error)
+                
+                if image_urls is not None:
+                    output['image_urls'] = image_urls
+                    output['image_count'] = len(image_urls)
+                else:
+                    base64_images = convert_images_to_base64(image_files)
+                    output['images'] = base64_images
+                    output['image_count'] = len(base64_images)
+                
                 # Send success webhook
-                send_webhook(webhook_url, 'COMPLETED', job_id, output=output)
+                send_webhook(job.webhook_url, 'COMPLETED', job.job_id, output=output)
                 
-                print(f"✅ Successfully generated {len(base64_images)} images for job {job_id}")
+                logger.info("✅ Successfully generated %d images for job %s", output['image_count'], job.job_id)
                 return output
                 
             else:
                 error_msg = "No images generated"
-                print(f"❌ {error_msg}")
-                send_webhook(webhook_url, 'FAILED', job_id, error=error_msg)
+                logger.error("❌ %s", error_msg)
+                send_webhook(job.webhook_url, 'FAILED', job.job_id, error=error_msg)
                 return {"error": error_msg}
                 
         except Exception as workflow_error:
             error_msg = f"Workflow execution failed: {str(workflow_error)}"
-            print(f"❌ {error_msg}")
-            send_webhook(webhook_url, 'FAILED', job_id, error=error_msg)
+            logger.error("❌ %s", error_msg)
+            send_webhook(job.webhook_url, 'FAILED', job.job_id, error=error_msg)
             return {"error": error_msg}
             
     except Exception as e:
         error_msg = f"Handler error: {str(e)}"
-        print(f"💥 {error_msg}")
+        logger.error("💥 %s", error_msg)
         return {"error": error_msg}
 
 # Initialize RunPod serverless
 if __name__ == "__main__":
-    print("🔥 Starting RunPod Text-to-Image Serverless Handler")
-    print(f"📁 Network volume path: {NETWORK_VOLUME}")
-    print(f"🖼️ ComfyUI path: {COMFYUI_PATH}")
+    logger.info("🔥 Starting RunPod Text-to-Image Serverless Handler")
+    logger.info("📁 Network volume path: %s", NETWORK_VOLUME)
+    logger.info("🖼️ ComfyUI path: %s", COMFYUI_PATH)
     
     # Validate environment
     if not os.path.exists(NETWORK_VOLUME):
-        print(f"⚠️ Warning: Network volume not found at {NETWORK_VOLUME}")
+        logger.warning("⚠️ Warning: Network volume not found at %s", NETWORK_VOLUME)
+    
+    # Pre-load models before accepting jobs
+    warmup_models()
     
     # Start RunPod serverless
     runpod.serverless.start({"handler": handler})